@@ -0,0 +1,67 @@
+"""
+Numeric kernels shared by the sampling hot path.
+
+Prefers the ahead-of-time compiled `_smoke_kernels` extension built by
+`smoke/_kernels_build.py` (see scripts/install), since first-call JIT
+compilation costs seconds on a Raspberry Pi & would eat the first sample
+cycle. When the extension isn't built, falls back to JIT-compiling the
+same code with a warm disk cache, & when numba isn't installed at all,
+to running it as plain Python — slower, but correct.
+"""
+
+import math
+
+import numpy as np
+
+# constants are baked in rather than taken as defaulted args because AOT
+# exports can't carry default values
+FIXED_RESISTOR = 100000.0
+BETA = 3950.0
+T0_INV = 1.0 / (25.0 + 273.15)
+
+
+def _steinhart_batch_py(vals: np.ndarray) -> np.ndarray:
+    """Convert an int32 array of raw ADC values to Celsius in one pass."""
+    out = np.empty(vals.size, dtype=np.float64)
+
+    for i in range(vals.size):
+        res = FIXED_RESISTOR / (65535.0 / vals[i] - 1.0)
+        steinhart = math.log(res / FIXED_RESISTOR) / BETA + T0_INV
+        out[i] = 1.0 / steinhart - 273.15
+
+    return out
+
+
+def _simple_slope_core_py(arr: np.ndarray) -> float:
+    """Fused slope & variance heuristic over an (N, 2) float64 array."""
+    n = arr.shape[0]
+    length = n - 1
+    sum_y = 0.0
+    sum_y2 = 0.0
+
+    for i in range(n):
+        y = arr[i, 1]
+        sum_y += y
+        sum_y2 += y * y
+
+    avg_slope = (arr[n - 1, 1] - arr[0, 1]) / (arr[n - 1, 0] - arr[0, 0])
+    avg_y = sum_y / n
+    variance_y = (sum_y2 - n * avg_y * avg_y) / length
+
+    return avg_slope * (1.0 + variance_y / 100.0)
+
+
+try:
+    # pylint: disable=no-name-in-module
+    from smoke._smoke_kernels import simple_slope_core, steinhart_batch
+except ImportError:
+    try:
+        from numba import njit
+
+        steinhart_batch = njit(cache=True, fastmath=True)(
+            _steinhart_batch_py)
+        simple_slope_core = njit(cache=True, fastmath=True)(
+            _simple_slope_core_py)
+    except ImportError:
+        steinhart_batch = _steinhart_batch_py
+        simple_slope_core = _simple_slope_core_py
@@ -0,0 +1,27 @@
+"""
+Ahead-of-time build script for the `_smoke_kernels` extension.
+
+Run `python -m smoke._kernels_build` at install time (scripts/install
+does this) to compile the hot numeric kernels to a native extension so
+runtime import is instant; otherwise `smoke._kernels` JIT-compiles them
+on first import instead.
+
+`numba.pycc` has been pending deprecation since numba 0.57 & will be
+dropped once its replacement lands, so requirements/prod.txt caps numba
+at the newest release verified to still ship it; bump that cap only
+after checking this script still compiles.
+"""
+
+from numba.pycc import CC
+
+from smoke._kernels import _simple_slope_core_py, _steinhart_batch_py
+
+cc = CC('_smoke_kernels')
+cc.output_dir = __file__.rsplit('/', 1)[0]
+
+cc.export('steinhart_batch', 'f8[:](i4[:])')(_steinhart_batch_py)
+cc.export('simple_slope_core', 'f8(f8[:,:])')(_simple_slope_core_py)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -18,7 +18,7 @@ from typing import Self
 import RPi.GPIO as IO
 
 # map speed ints to PWM duty cycles
-SPEEDS = [0, 35, 65, 90]
+SPEEDS: tuple[int, ...] = (0, 35, 65, 90)
 
 
 class Fan:
@@ -39,6 +39,7 @@ class Fan:
     """
 
     _fan: IO.PWM
+    _speed: int
 
     def __init__(self, pin: int) -> None:
         """Initialize a fan object with the given PWM pin."""
@@ -47,14 +48,21 @@ class Fan:
         IO.setup(pin, IO.OUT)
         self._fan = IO.PWM(pin, 100)
         self._fan.start(0)
+        self._speed = 0
 
     def set_speed(self, speed: int) -> None:
         """Set the speed to 0, 1, 2, or 3 where 0 is off & 3 is fastest."""
-        try:
-            self._fan.ChangeDutyCycle(SPEEDS[speed])
-        except IndexError:
+        if speed < 0 or speed >= len(SPEEDS):
             raise IndexError(f'Speed {speed} is invalid, please provide a ' +
-                             'number from 0 to 4.')
+                             f'number from 0 to {len(SPEEDS) - 1}.')
+
+        # writing an unchanged duty cycle mid-period glitches the PWM
+        # output, so skip the hardware write when nothing changed
+        if speed == self._speed:
+            return
+
+        self._fan.ChangeDutyCycle(SPEEDS[speed])
+        self._speed = speed
 
     def __enter__(self) -> Self:
         return self
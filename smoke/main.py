@@ -1,10 +1,37 @@
-from time import sleep
+import asyncio
+from time import monotonic
+from typing import List, Optional
+
+import uvicorn
+
 from smoke.fan import Fan
-from smoke.maintain import maintain
+from smoke.maintain import SAMPLE_RATE, maintain_async
+from smoke.pubsub import ChannelSPMCAsync
+from smoke.server import app, sample_channel
 from smoke.thermistor import Probes
 
 
-def main() -> None:
+async def sampler(
+    probes: Probes,
+    channel: ChannelSPMCAsync[List[Optional[float]], None]
+) -> None:
+    """Publish each new reading of all probe temps to the given channel."""
+    next_tick = monotonic() + SAMPLE_RATE
+
+    while True:
+        await channel.pub(probes.temps())
+
+        # schedule against the monotonic clock so publish time doesn't
+        # drift the sample interval
+        sleep_for = next_tick - monotonic()
+
+        if sleep_for > 0:
+            await asyncio.sleep(sleep_for)
+
+        next_tick += SAMPLE_RATE
+
+
+async def main() -> None:
     # set up probes 1 & 2 w/ air on 1 & food on 2
     probes = Probes([1, 2])
     air = probes.get_probe(1)
@@ -20,10 +47,26 @@ def main() -> None:
         if air is not None and food is not None:
             print(f'Maintaining a target temp of {target}' +
                   'C, enter CTRL-C to quit')
-            maintain(target, air, fan, food)
+            # push readings to any websocket clients alongside the
+            # control loop on the same event loop
+            sample_task = asyncio.create_task(
+                sampler(probes, sample_channel))
+            # serve the api on this same loop — the sampler publishes
+            # into the server's channel, so its websocket handlers must
+            # share the process (& the loop) to ever hear a sample
+            server = uvicorn.Server(uvicorn.Config(
+                app, host="0.0.0.0", port=8000))
+            server_task = asyncio.create_task(server.serve())
+
+            try:
+                await maintain_async(target, air, fan, food)
+            finally:
+                sample_task.cancel()
+                server.should_exit = True
+                await server_task
         else:
             print("There is no air probe plugged in on channel 1")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -20,8 +20,12 @@ maintain(107, air, fan)   # maintain an air temp of 107 C
 ```
 """
 
-from time import sleep
-from typing import List, Self
+import asyncio
+import sys
+from time import monotonic
+from typing import Optional, Self
+
+import numpy as np
 
 from smoke.fan import Fan
 from smoke.thermistor import Probe
@@ -43,47 +47,205 @@ TRENDS = {
     "medium": PRECISION / 100,
     "small": PRECISION / 1000,
 }
+# quantization edges for binning a (diff, trend) pair with searchsorted;
+# both must be ascending
+DIFF_EDGES = np.array(
+    [0 - PRECISION, PRECISION, DIFFS["medium"], DIFFS["large"]])
+TREND_EDGES = np.array(
+    [TRENDS["small"], TRENDS["medium"], TRENDS["large"]])
+# fan speed for each (diff bin, trend bin) pair; -1 means leave the fan
+# speed alone
+SPEED_TABLE = np.array([
+    [0, 0, 0, 0],      # overshot the target by more than PRECISION
+    [-1, -1, -1, -1],  # diff is insignificant, hold
+    [1, 0, 0, 0],      # small diff
+    [2, 1, 0, 0],      # medium diff
+    [3, 2, 1, 1],      # large diff
+], dtype=np.int8)
+
+
+class PID:
+    """
+    A discrete-time PID controller with a clamped output range.
+
+    Computes u(k) = Kp*e + Ki*Σe*dt + Kd*(e - e_prev)/dt on each `step`
+    call. The integral term is clamped so it can never drive the output
+    beyond its bounds on its own (anti-windup), & `reset` dumps the
+    accumulated integral, e.g. when crossing the setpoint.
+    """
+
+    _kp: float
+    _ki: float
+    _kd: float
+    _out_lo: float
+    _out_hi: float
+    _integral: float
+    _prev_err: Optional[float]
+
+    def __init__(
+        self,
+        kp: float,
+        ki: float,
+        kd: float,
+        out_lo: float = 0.0,
+        out_hi: float = 3.0
+    ) -> None:
+        """Initialize a controller with the given gains & output bounds."""
+        self._kp = kp
+        self._ki = ki
+        self._kd = kd
+        self._out_lo = out_lo
+        self._out_hi = out_hi
+        self._integral = 0.0
+        self._prev_err = None
+
+    def step(self, err: float, dt: float) -> float:
+        """Advance the controller by dt & return the clamped output."""
+        self._integral += err * dt
+
+        # anti-windup: keep the integral contribution inside the output
+        # range so it unwinds quickly after a long approach
+        if self._ki > 0.0:
+            self._integral = min(
+                max(self._integral, self._out_lo / self._ki),
+                self._out_hi / self._ki)
+
+        deriv = 0.0 \
+            if self._prev_err is None \
+            else (err - self._prev_err) / dt
+        self._prev_err = err
+
+        out = self._kp * err + self._ki * self._integral + self._kd * deriv
+
+        return min(max(out, self._out_lo), self._out_hi)
+
+    def reset(self) -> None:
+        """Dump the accumulated integral & derivative state."""
+        self._integral = 0.0
+        self._prev_err = None
 
 
-# TODO: there might be a better built-in data structure for this
 class NHistory:
-    _values: List[float]
-    _max: int
+    # fixed-size ring buffer: pushes are O(1) stores into a preallocated
+    # array instead of O(n) list pop(0) shuffles
+    _buf: np.ndarray
+    _head: int
+    _count: int
 
     def __init__(self, n: int) -> None:
-        self._values = []
-        self._max = n
+        self._buf = np.empty(n, dtype=np.float64)
+        self._head = 0
+        self._count = 0
 
     def push(self, value: float) -> Self:
-        self._values.append(value)
-
-        if len(self._values) > self._max:
-            self._values.pop(0)
+        self._buf[self._head % self._buf.size] = value
+        self._head += 1
+        self._count = min(self._count + 1, self._buf.size)
 
         return self
 
-    def get_values(self) -> List[float]:
-        return self._values
+    def get_values(self) -> np.ndarray:
+        if self._count < self._buf.size:
+            return self._buf[:self._count]
+
+        split = self._head % self._buf.size
 
+        return np.concatenate((self._buf[split:], self._buf[:split]))
 
-def maintain(target: float, air: Probe, fan: Fan, food: Probe) -> None:
+
+# PID gains sized so a DIFFS["large"] error alone saturates the fan;
+# overridable for autotuning
+KP_DEFAULT = 3 / DIFFS["large"]
+KI_DEFAULT = 0.0005
+KD_DEFAULT = 0.05
+
+
+def maintain(
+    target: float,
+    air: Probe,
+    fan: Fan,
+    food: Probe,
+    kp: float = KP_DEFAULT,
+    ki: float = KI_DEFAULT,
+    kd: float = KD_DEFAULT
+) -> None:
+    """
+    Attempts to maintain the given target temperature.
+
+    Blocking wrapper around `maintain_async` for callers that aren't
+    already running an event loop.
+    """
+    asyncio.run(maintain_async(target, air, fan, food, kp, ki, kd))
+
+
+async def maintain_async(
+    target: float,
+    air: Probe,
+    fan: Fan,
+    food: Probe,
+    kp: float = KP_DEFAULT,
+    ki: float = KI_DEFAULT,
+    kd: float = KD_DEFAULT
+) -> None:
     """
     Attempts to maintain the given target temperature.
 
     Uses the given Probe & Fan objects to read the current temperature in a
-    loop & control the fan speed accordingly.
+    loop & control the fan speed with a PID controller quantized to the
+    fan's speed levels. Awaits between samples so it can share an event
+    loop with the api server & samplers.
     """
     # initialize an object for storing the last 10 minutes of temperature data
     history = NHistory(60)
+    pid = PID(kp, ki, kd)
+    prev_err: Optional[float] = None
+    last_speed: Optional[int] = None
+    next_tick = monotonic() + SAMPLE_RATE
 
     while True:
         # get current temp & push it onto the history
         current_temp = air.get_temp_c()
         history.push(current_temp)
-        # update fan speed
-        set_fan_from_temp_and_target(fan, target, history)
-        # wait for 10 seconds & then repeat
-        sleep(SAMPLE_RATE)
+        err = target - current_temp
+
+        # dump integral windup when crossing the setpoint to curb overshoot
+        if prev_err is not None and (err > 0) != (prev_err > 0):
+            pid.reset()
+
+        prev_err = err
+
+        # quantize the PID output to the fan's speed levels & only touch
+        # the PWM when the level actually changes
+        speed = int(round(pid.step(err, SAMPLE_RATE)))
+
+        if speed != last_speed:
+            fan.set_speed(speed)
+            last_speed = speed
+
+        # the trend over the history doesn't feed the controller (the
+        # derivative term covers that), but it's the number a cook
+        # watches, so report it each tick
+        trend = find_trend(history.get_values(), SAMPLE_RATE)
+
+        # report the tick as one buffered write & flush rather than a
+        # print per line, each of which locks & flushes stdout; the food
+        # read shares the air read's SPI refresh within the same tick
+        sys.stdout.write(f'Air: {current_temp:.2f}C\n'
+                         f'Food: {food.get_temp_c():.2f}C\n'
+                         f'Diff: {err:.2f}C\n'
+                         f'Trend: {trend:.4f}C/s\n'
+                         f'Fan: {speed}\n')
+        sys.stdout.flush()
+
+        # sleep until the next scheduled tick instead of a flat
+        # SAMPLE_RATE so the work above doesn't drift the sample interval
+        # the trend slope & PID integral both assume
+        sleep_for = next_tick - monotonic()
+
+        if sleep_for > 0:
+            await asyncio.sleep(sleep_for)
+
+        next_tick += SAMPLE_RATE
 
 
 def set_fan_from_temp_and_target(
@@ -91,47 +253,19 @@ def set_fan_from_temp_and_target(
     target: float,
     temps: NHistory
 ) -> None:
-    """Set fan seed according to latest temp and trends."""
+    """Set fan speed according to latest temp and trends."""
     values = temps.get_values()
     # determine the trending rate of change based on the history
     trend = find_trend(values, SAMPLE_RATE)
     # determine how far off the current temp is from the target
     diff = target - values[-1]
 
-    # if diff is significantly negative, turn off the fan
-    if diff < (0 - PRECISION):
-        fan.set_speed(0)
-
-    # if diff is large, set fan sped to fastest
-    elif diff > DIFFS["large"]:
-        # and trend is small, set fan speed to fast
-        if trend < TRENDS["small"]:
-            fan.set_speed(3)
-        # and trend is medium, set fan speed to medium
-        if trend < TRENDS["medium"]:
-            fan.set_speed(2)
-        # and trend is large, set fan speed to slow
-        if trend < TRENDS["large"]:
-            fan.set_speed(1)
-
-    # if diff is medium
-    elif diff > DIFFS["medium"]:
-        # and trend is small, set fan speed to medium
-        if trend < TRENDS["small"]:
-            fan.set_speed(2)
-        # and trend is medium, set fan speed to slow
-        if trend < TRENDS["medium"]:
-            fan.set_speed(1)
-        # and trend is large, set fan speed to off
-        if trend < TRENDS["large"]:
-            fan.set_speed(0)
-
-    # if diff is small
-        # and trend is small, set fan speed to slow
-        if trend < TRENDS["small"]:
-            fan.set_speed(1)
-        # and trend is medium or large, set fan speed to off
-        if trend < TRENDS["medium"]:
-            fan.set_speed(0)
-
-    # if diff is insignificant, do nothing
+    # quantize (diff, trend) into bins & look up the speed; one branch &
+    # at most one set_speed call per tick instead of the old cascade,
+    # which could fire several PWM writes on a single sample
+    diff_bin = int(np.searchsorted(DIFF_EDGES, diff))
+    trend_bin = int(np.searchsorted(TREND_EDGES, trend))
+    speed = int(SPEED_TABLE[diff_bin, trend_bin])
+
+    if speed >= 0:
+        fan.set_speed(speed)
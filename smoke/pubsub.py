@@ -2,9 +2,19 @@ r"""
 A couple of simple pub sub utilities for concurrent event handling.
 """
 
-from asyncio import gather
-from threading import Thread
-from typing import Awaitable, Callable, Generic, List, Self, TypeVar
+import os
+from asyncio import TaskGroup
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Generic,
+    List,
+    Self,
+    Tuple,
+    TypeVar,
+)
 
 
 T = TypeVar('T')
@@ -16,30 +26,46 @@ class ChannelSPMCAsync(Generic[T, R]):
 
     # FIXME: maybe T could be a generic list of type arguments instead of
     # just one argument
-    _subs: List[Callable[[T], Awaitable[R]]]
+    # subscribers must return coroutines (not just any awaitable):
+    # TaskGroup.create_task accepts nothing weaker
+    _subs: Tuple[Callable[[T], Coroutine[Any, Any, R]], ...]
 
     def __init__(self) -> None:
-        self._subs = []
+        self._subs = ()
 
-    def sub(self, sub: Callable[[T], Awaitable[R]]) -> Self:
+    def sub(self, sub: Callable[[T], Coroutine[Any, Any, R]]) -> Self:
         """Subscribe a function to the channel."""
-        self._subs.append(sub)
+        # subscriptions are rare & publishes are hot, so rebuild an
+        # immutable tuple here & iterate it allocation-free in pub
+        self._subs = (*self._subs, sub)
+
+        return self
+
+    def unsub(self, sub: Callable[[T], Coroutine[Any, Any, R]]) -> Self:
+        """Unsubscribe a previously subscribed function from the channel."""
+        self._subs = tuple(s for s in self._subs if s is not sub)
 
         return self
 
     async def pub(self, arg: T) -> None:
         """Publish an event with the given arg."""
-        futures = [sub(arg) for sub in self._subs]
-        await gather(*futures)
+        async with TaskGroup() as task_group:
+            for sub in self._subs:
+                task_group.create_task(sub(arg))
 
 
 class ChannelSPMCThreaded(Generic[T, R]):
     """A threaded event channel for registering subscribers to a publisher."""
 
     _subs: List[Callable[[T], R]]
+    _exec: ThreadPoolExecutor
 
     def __init__(self) -> None:
         self._subs = []
+        # reuse a pool of workers instead of spawning a fresh Thread per
+        # subscriber per event, which costs a clone + stack mmap each time
+        self._exec = ThreadPoolExecutor(max_workers=max(
+            4, os.cpu_count() or 4))
 
     def sub(self, sub: Callable[[T], R]) -> Self:
         """Subscribe a function to the channel."""
@@ -47,17 +73,16 @@ class ChannelSPMCThreaded(Generic[T, R]):
 
         return self
 
-    def pub(self, arg: T) -> List[Thread]:
+    def pub(self, arg: T) -> List[Future[R]]:
         """Publish an event with the given arg."""
-        threads = []
+        return [self._exec.submit(sub, arg) for sub in self._subs]
 
-        for sub in self._subs:
-            threads.append(Thread(
-                target=sub,
-                args=[arg],
-            ))
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        self._exec.shutdown()
 
-        for thread in threads:
-            thread.start()
+    def __enter__(self) -> Self:
+        return self
 
-        return threads
+    def __exit__(self, _, __, ___) -> None:
+        self.close()
@@ -1,10 +1,19 @@
 import asyncio
-from typing import NoReturn
-from fastapi import FastAPI, WebSocket
-from fastapi.responses import HTMLResponse
+import gzip
+import hashlib
+from typing import List, NoReturn, Optional
+from fastapi import FastAPI, Request, WebSocket
+from fastapi.responses import Response
+
+from smoke.pubsub import ChannelSPMCAsync
 
 app = FastAPI()
 
+# the sampling loop publishes each new reading here; websocket handlers
+# subscribe instead of polling on a timer
+sample_channel: ChannelSPMCAsync[List[Optional[float]], None] = \
+    ChannelSPMCAsync()
+
 WS_HTML = """
 <!DOCTYPE html>
 <html>
@@ -40,9 +49,46 @@ WS_HTML = """
 """
 
 
+# the pages are constant, so compress & fingerprint them once at import
+# instead of re-encoding ~1 KB of HTML per request
+_WS_HTML_GZ = gzip.compress(WS_HTML.encode())
+_WS_ETAG = '"' + hashlib.md5(WS_HTML.encode()).hexdigest() + '"'
+
+
+def _static(body_gz: bytes, etag: str, request: Request) -> Response:
+    """Serve a pre-gzipped constant page, short-circuiting to 304 on hits."""
+    # the same caching headers go on every response: RFC 7232 wants the
+    # 304 to repeat what the 200 would have sent, & Vary tells shared
+    # caches not to replay one encoding's body to the other's clients
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=3600",
+        "Vary": "Accept-Encoding",
+    }
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    # only hand out the precompressed body to clients that accept gzip;
+    # everyone else (curl, embedded clients) gets it decompressed, a
+    # cost only paid on the cold path
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+
+        return Response(
+            content=body_gz,
+            media_type="text/html",
+            headers=headers)
+
+    return Response(
+        content=gzip.decompress(body_gz),
+        media_type="text/html",
+        headers=headers)
+
+
 @app.get("/")
-async def index() -> HTMLResponse:
-    return HTMLResponse(WS_HTML)
+async def index(request: Request) -> Response:
+    return _static(_WS_HTML_GZ, _WS_ETAG, request)
 
 
 @app.websocket("/ws")
@@ -77,19 +123,33 @@ TEST_HTML = """
 """
 
 
+_TEST_HTML_GZ = gzip.compress(TEST_HTML.encode())
+_TEST_ETAG = '"' + hashlib.md5(TEST_HTML.encode()).hexdigest() + '"'
+
+
 @app.get("/test")
-async def test() -> HTMLResponse:
-    return HTMLResponse(TEST_HTML)
+async def test(request: Request) -> Response:
+    return _static(_TEST_HTML_GZ, _TEST_ETAG, request)
 
 
 @app.websocket("/data-stream")
 async def socket_test(websocket: WebSocket) -> NoReturn:
     await websocket.accept()
 
-    while True:
-        await websocket.send_json({
-            'message': 'this is a test',
-            'number': 1,
-            'bool': True
-        })
-        await asyncio.sleep(1)
+    # bridge published samples onto this connection through a queue so
+    # each client only wakes when there's a new reading to send
+    queue: asyncio.Queue[List[Optional[float]]] = asyncio.Queue()
+
+    async def forward(sample: List[Optional[float]]) -> None:
+        await queue.put(sample)
+
+    sample_channel.sub(forward)
+
+    # detach on the way out no matter how the connection dies, or the
+    # subscriber & its queue would pile up samples for the life of the
+    # process
+    try:
+        while True:
+            await websocket.send_json(await queue.get())
+    finally:
+        sample_channel.unsub(forward)
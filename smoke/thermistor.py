@@ -34,62 +34,146 @@ probes.temps() => [35.5, None, None, 95.2, None, None, None, None]
 """
 
 import math
-from typing import Dict, List, Optional, Self
+from math import log as _log
+from time import monotonic
+from typing import TYPE_CHECKING, Callable, List, Optional, Self, Tuple
 
-import adafruit_mcp3xxx.mcp3008 as MCP
-from adafruit_mcp3xxx.analog_in import AnalogIn
-import digitalio
-import board
-import busio
+import numpy as np
+
+if TYPE_CHECKING:
+    import board
+    import busio
+    import digitalio
+
+from smoke._kernels import steinhart_batch as _steinhart_batch
 
 FIXED_RESISTOR = 100000.0
-PROBES = MCP.P0, MCP.P1, MCP.P2, MCP.P3, MCP.P4, MCP.P5, MCP.P6, MCP.P7
+# reads averaged per sample to cut ADC quantization noise; must stay a
+# power of two so the average is a shift
+OVERSAMPLE = 16
+# minimum seconds between SPI refreshes; readers that ask again inside
+# this window share the last reading instead of re-polling the bus
+MIN_REFRESH = 1.0
+# hoisted Steinhart-Hart constants for the default probe model, precomputed
+# once so the per-sample path only multiplies & adds
+T0_INV = 1.0 / (25.0 + 273.15)
+INV_BETA = 1.0 / 3950.0
+_LOG_FIXED_RESISTOR = math.log(FIXED_RESISTOR)
+# MCP3008 single-ended read command frames, one per channel, built once at
+# import so batched reads join slices instead of allocating small bytes
+# objects every tick
+_SPI_CMDS = tuple(
+    bytes([0x01, 0x80 | (ch << 4), 0x00]) for ch in range(8))
+# preformatted message for the inlined probe-number range checks
+_BAD_PROBE_NUM = ('Probe number {} is invalid. Please specify probes '
+                  'only as numbers 1 through {}.')
+# shared by every scalar path that refuses to convert a raw 0
+_OPEN_CIRCUIT = ('ADC value 0 reads as an open circuit; '
+                 'is the probe plugged in?')
+
+
+def _lazy_import() -> None:
+    """
+    Import the GPIO & SPI bindings on first board construction.
+
+    These pull in pin-mux tables & RPi GPIO bindings — several hundred
+    ms of import time on a Pi Zero — so they're deferred until a board
+    actually exists; consumers that only want the conversion math or
+    trend tools never pay for them.
+    """
+    global board, busio, digitalio
+
+    import board
+    import busio
+    import digitalio
+
+
+def adc_to_c(value: int) -> float:
+    """
+    Convert a raw ADC value directly to Celsius.
+
+    Fuses `resistance` & `steinhart_temperature_c` into one expression for
+    the default fixed resistor & probe model; since the Steinhart form only
+    uses the ratio r/fixed, FIXED_RESISTOR cancels out entirely.
+    """
+    return 1.0 / (
+        _log(1.0 / (65535.0 / value - 1.0)) * INV_BETA + T0_INV
+    ) - 273.15
+
+
+def make_adc_to_c(
+    nominal_resistance: float = 25.0,
+    beta: float = 3950.0
+) -> Callable[[int], float]:
+    """
+    Build an ADC-to-Celsius converter specialized to one probe model.
+
+    Bakes the reciprocals for the given model into a closure so the hot
+    path is one log & a few multiply-adds with no default-arg lookups;
+    the fixed resistor cancels out of the ratio form entirely, so it
+    needs no parameter.
+    """
+    inv_beta = 1.0 / beta
+    inv_t0 = 1.0 / (nominal_resistance + 273.15)
+
+    return lambda value: 1.0 / (
+        _log(1.0 / (65535.0 / value - 1.0)) * inv_beta + inv_t0
+    ) - 273.15
 
 
 class Probe:
     """
-    An object representing a single probe.
+    A lightweight view of a single probe on a `Probes` board.
 
-    Used to get the temperature reading of that probe as a float or string in
-    Celsius or Fahrenheit.
+    Used to get the temperature reading of that probe as a float or string
+    in Celsius. All per-probe state lives in parallel arrays on the parent
+    board; this object just remembers which slot it refers to.
     """
 
-    _channel: AnalogIn
+    _board: "Probes"
     _num: int
-    _name: Optional[str]
 
-    def __init__(self, mcp: MCP.MCP3008, channel: int) -> None:
-        """Initialize a probe on the given MCP3008 data channel."""
-        self._channel = AnalogIn(mcp, PROBES[channel])
-        self._num = channel + 1
-        self._name = None
+    def __init__(self, probes: "Probes", num: int) -> None:
+        """Initialize a view of the given probe number on the board."""
+        self._board = probes
+        self._num = num
+
+    def get_raw(self) -> int:
+        """Get the current raw ADC value of the probe."""
+        return int(self._board.read_all_raw()[self._num - 1])
 
     def get_temp_c(self) -> float:
         """Get the current temperature of the probe in Celsius."""
-        res = resistance(self._channel.value)
+        raw = self.get_raw()
 
-        return steinhart_temperature_c(res)
+        if raw == 0:
+            raise ValueError(_OPEN_CIRCUIT)
+
+        return self._board._adc_to_c(raw)
 
     def set_name(self, name: str) -> None:
         """Set the probe's name as the given string."""
-        self._name = name
+        self._board._set_name(self._num, name)
 
     def get_name(self) -> Optional[str]:
         """Get the probe's name."""
-        return self._name
+        return self._board._names[self._num - 1]
 
     def unset_name(self) -> None:
         """Unname the probe."""
-        self._name = None
+        self._board._set_name(self._num, None)
 
     def get_identifier(self) -> str:
         """Get the probe's name, or number if it doesn't have one."""
-        return self._name if self._name is not None else str(self._num)
+        name = self.get_name()
+
+        return name if name is not None else str(self._num)
 
     def __str__(self) -> str:
         """Render the current temperature of the probe as a string."""
-        prefix = f'{self._name} [{self._num}]' \
-            if self._name is not None \
+        name = self.get_name()
+        prefix = f'{name} [{self._num}]' \
+            if name is not None \
             else f'Probe {self._num}'
 
         return f'{prefix}: {self.get_temp_c()}'
@@ -107,15 +191,32 @@ class Probes:
     ```
 
     means probes 1 & 3 are available while 2, 4, 5, 6, 7, & 8 are not.
+
+    Probe state is kept as parallel arrays (raw readings, enabled flags, &
+    names) so a sample is one batched SPI read feeding one vectorized
+    conversion, rather than a Python object traversal per channel.
     """
 
     _air_probe: Optional[int]
-    _cs: digitalio.DigitalInOut
-    _probes: List[Optional[Probe]]
+    _cs: "digitalio.DigitalInOut"
+    _enabled: np.ndarray
+    _enabled_idx: np.ndarray
+    _last_read: float
+    _names: List[Optional[str]]
+    _raw: np.ndarray
+    _raw_version: int
     _max_probes: int
-    _mcp: MCP.MCP3008
-    _spi: busio.SPI
+    _spi: "busio.SPI"
+    _str_cache: str
+    _str_version: int
     _target_probe: Optional[int]
+    _temps_cache: List[Optional[float]]
+    _temps_version: int
+    _tx_frames: Tuple[bytes, ...]
+    _rx: bytearray
+    _rx_frames: Tuple[memoryview, ...]
+    _acc: np.ndarray
+    _adc_to_c: Callable[[int], float]
 
     def __init__(
         self,
@@ -132,48 +233,171 @@ class Probes:
         Probes([1,3])
         ```
         """
-        self._probes = [None]*max_probes
+        _lazy_import()
+
+        self._enabled = np.zeros(max_probes, dtype=bool)
+        self._names = [None]*max_probes
+        self._raw = np.zeros(max_probes, dtype=np.int32)
         self._spi = busio.SPI(
             clock=board.SCK,
             MISO=board.MISO,
             MOSI=board.MOSI)
         self._cs = digitalio.DigitalInOut(board.D5)
-        self._mcp = MCP.MCP3008(self._spi, self._cs)
+        # the raw-SPI read path replaced Adafruit's SPIDevice, which did
+        # the bus setup implicitly: chip select must be an output idling
+        # high, & the bus clocked at the MCP3008's rate in SPI mode 0
+        self._cs.switch_to_output(value=True)
+
+        while not self._spi.try_lock():
+            pass
+
+        try:
+            self._spi.configure(baudrate=100000, polarity=0, phase=0)
+        finally:
+            self._spi.unlock()
+
         self._max_probes = max_probes
         self._air_probe = None
         self._target_probe = None
+        self._last_read = float('-inf')
+        self._raw_version = 0
+        self._str_cache = ""
+        self._str_version = -1
+        self._temps_cache = []
+        self._temps_version = -1
+        self._enabled_idx = np.flatnonzero(self._enabled)
+        self._tx_frames = ()
+        self._rx = bytearray(0)
+        self._rx_frames = ()
+        self._acc = np.zeros(0, dtype=np.uint32)
+        # scalar converter specialized to the default probe model; swap
+        # in a make_adc_to_c closure for probes with a different beta
+        self._adc_to_c = make_adc_to_c()
 
         for probe in probe_nums:
             self.add_probe(probe)
 
+        # warm the kernel so the first real sample doesn't pay JIT
+        # compilation time (a no-op when the AOT extension is built)
+        _steinhart_batch(np.ones(1, dtype=np.int32))
+
     def add_probe(self, num: int) -> Self:
-        """Initialize probe for given number."""
-        self._check_valid_probe_num(num)
-        index = num - 1
-        self._probes[index] = Probe(self._mcp, index)
+        """Enable the probe for the given number."""
+        if not 1 <= num <= self._max_probes:
+            raise IndexError(_BAD_PROBE_NUM.format(num, self._max_probes))
+        self._enabled[num - 1] = True
+        self._rebuild_spi_payload()
 
         return self
 
+    def _rebuild_spi_payload(self) -> None:
+        # cache the dense enabled indices, each enabled channel's command
+        # frame, & matching receive/accumulator buffers; rebuilt only here
+        # so the per-tick read sends zero bytes for disabled channels &
+        # allocates nothing. The receive views are 3-byte windows into one
+        # shared buffer so the replies still decode in a single
+        # vectorized pass.
+        self._enabled_idx = np.flatnonzero(self._enabled)
+        self._tx_frames = tuple(
+            _SPI_CMDS[idx] for idx in self._enabled_idx)
+        self._rx = bytearray(3 * len(self._tx_frames))
+        rx_view = memoryview(self._rx)
+        self._rx_frames = tuple(
+            rx_view[i * 3:(i + 1) * 3]
+            for i in range(len(self._tx_frames)))
+        self._acc = np.zeros(self._enabled_idx.size, dtype=np.uint32)
+
     def get_probe(self, num: int) -> Optional[Probe]:
         """
         Get the probe object a given channel number.
 
-        Returns None if probe is not initialized, otherwise returns the Probe.
+        Returns None if probe is not enabled, otherwise returns the Probe.
         """
-        self._check_valid_probe_num(num)
+        if not 1 <= num <= self._max_probes:
+            raise IndexError(_BAD_PROBE_NUM.format(num, self._max_probes))
+
+        if not self._enabled[num - 1]:
+            return None
 
-        return self._probes[num - 1]
+        return Probe(self, num)
+
+    def read_all_raw(self) -> np.ndarray:
+        """
+        Read raw ADC values for every enabled probe under one bus lock.
+
+        Sends the prebuilt MCP3008 command frames for all enabled channels
+        back-to-back under a single bus lock instead of paying the lock &
+        buffer setup once per channel, & repeats the sweep OVERSAMPLE
+        times, averaging the readings to squeeze extra effective bits out
+        of the 10-bit ADC. Chip select still toggles around each frame —
+        the chip only starts a new conversion on a falling CS edge.
+        Returns an int32 array indexed by probe number - 1 with disabled
+        slots as 0, scaled to 16 bits to match the Adafruit driver's
+        `AnalogIn.value`.
+
+        Calls landing within MIN_REFRESH of the last transfer share that
+        reading, so a logger & a websocket handler sampling in the same
+        tick only cost one trip over the bus.
+        """
+        now = monotonic()
+
+        if now - self._last_read < MIN_REFRESH:
+            return self._raw
+
+        self._last_read = now
+        self._raw_version += 1
+        self._raw[:] = 0
+        enabled = self._enabled_idx
+
+        if enabled.size == 0:
+            return self._raw
+
+        acc = self._acc
+        acc[:] = 0
+
+        while not self._spi.try_lock():
+            pass
+
+        try:
+            for _ in range(OVERSAMPLE):
+                for out, inp in zip(self._tx_frames, self._rx_frames):
+                    self._cs.value = False
+                    self._spi.write_readinto(out, inp)
+                    self._cs.value = True
+
+                # decode all 3-byte reply frames at once: the low 2 bits
+                # of byte 1 are the reading's high bits, byte 2 the rest
+                frames = np.frombuffer(
+                    self._rx, dtype=np.uint8).reshape(-1, 3)
+                acc += (
+                    (frames[:, 1].astype(np.uint32) & 0x03) << 8
+                ) | frames[:, 2]
+        finally:
+            self._spi.unlock()
+
+        # scale the accumulated sum straight to AnalogIn.value's 16-bit
+        # range: x64 for the 10 -> 16 bit shift over /OVERSAMPLE(16) for
+        # the average is a net << 2. Averaging before scaling would
+        # round the sum back onto the 10-bit grid, throwing away the
+        # sub-LSB resolution oversampling exists to capture
+        self._raw[enabled] = (acc << 2).astype(np.int32)
+
+        return self._raw
 
     def remove_probe(self, num: int) -> Self:
-        """Remove probe for given number."""
-        self._check_valid_probe_num(num)
-        self._probes[num - 1] = None
+        """Disable the probe for the given number."""
+        if not 1 <= num <= self._max_probes:
+            raise IndexError(_BAD_PROBE_NUM.format(num, self._max_probes))
+        self._enabled[num - 1] = False
+        self._names[num - 1] = None
+        self._rebuild_spi_payload()
 
         return self
 
     def set_air_probe(self, num: int) -> Self:
         """Set the probe at the given number as the air temperature probe."""
-        self._check_valid_probe_num(num)
+        if not 1 <= num <= self._max_probes:
+            raise IndexError(_BAD_PROBE_NUM.format(num, self._max_probes))
 
         if self.get_probe(num) is None:
             raise ValueError(f'Probe number {num} is not set up. ' +
@@ -212,7 +436,8 @@ class Probes:
 
     def set_target_probe(self, num: int) -> Self:
         """Set probe at the given number as the target temperature probe."""
-        self._check_valid_probe_num(num)
+        if not 1 <= num <= self._max_probes:
+            raise IndexError(_BAD_PROBE_NUM.format(num, self._max_probes))
 
         if self.get_probe(num) is None:
             raise ValueError(f'Probe number {num} is not set up. ' +
@@ -234,7 +459,7 @@ class Probes:
         """Unset the probe currently designated as the target probe."""
         if self._target_probe is not None:
             probe = self.get_target_probe()
-            
+
             if probe is not None:
                 probe.unset_name()
 
@@ -253,39 +478,65 @@ class Probes:
 
         return self.get_probe(self._target_probe)
 
-    def temps(self) -> Dict[str, Optional[float]]:
+    def temps(self) -> List[Optional[float]]:
         """
         Get current temps for all probes.
 
-        Temps are represented in Celsius as floats w/ uninitialized probes as
-        None.
+        Temps are represented in Celsius as floats, indexed by probe
+        number - 1, w/ disabled probes as None — the layout documented in
+        the module docstring.
         """
-        output: Dict[str, Optional[float]] = {}
+        vals = self.read_all_raw()
+
+        if self._temps_version != self._raw_version:
+            # a raw 0 would divide by zero in the kernel, so convert a
+            # harmless 1 in its place & mask the result back out below:
+            # disabled slots stay None, & so does an enabled probe that
+            # reads 0 — that's an open circuit, not a temperature (the
+            # scalar `resistance` path raises for the same condition)
+            converted = _steinhart_batch(np.where(vals > 0, vals, 1))
 
-        for idx, probe in enumerate(self._probes):
-            if probe is None:
-                output[str(idx)] = None
-            else:
-                output[probe.get_identifier()] = probe.get_temp_c()
+            # scatter readings into a fresh all-None scaffold: one pass
+            # over the dense enabled indices, no per-slot branching
+            output: List[Optional[float]] = [None] * self._max_probes
 
-        return output
+            for idx in self._enabled_idx:
+                if vals[idx] > 0:
+                    output[idx] = float(converted[idx])
 
-    def _check_valid_probe_num(self, num: int) -> None:
-        if num < 1 or num > self._max_probes:
-            raise IndexError(
-                f'Probe number {num} is invalid. ' +
-                'Please specify probes only as numbers 1 through ' +
-                f'{self._max_probes}.')
+            self._temps_cache = output
+            self._temps_version = self._raw_version
+
+        # hand out a copy so callers can't mutate the cache
+        return list(self._temps_cache)
+
+    def _set_name(self, num: int, name: Optional[str]) -> None:
+        self._names[num - 1] = name
+        # names feed the rendered caches, so count a rename as new data
+        self._raw_version += 1
 
     def __str__(self) -> str:
         """Get newline-separated list of current temps by probe number."""
-        output_list: List[str] = []
+        vals = self.read_all_raw()
 
-        for probe in self._probes:
-            if probe is not None:
-                output_list.append(str(probe))
+        if self._str_version != self._raw_version:
+            # one vectorized conversion for the whole board instead of a
+            # Python-level adc_to_c call per probe; an enabled probe
+            # reading 0 is an open circuit, so show nan rather than the
+            # garbage temperature the placeholder 1 converts to
+            converted = _steinhart_batch(np.where(vals > 0, vals, 1))
+            converted[vals == 0] = np.nan
 
-        return "\n".join(output_list)
+            # one join over a generator: no intermediate list & no
+            # Python-level append per probe
+            self._str_cache = "\n".join(
+                f'{self._names[idx]} [{idx + 1}]: {converted[idx]}'
+                if self._names[idx] is not None
+                else f'Probe {idx + 1}: {converted[idx]}'
+                for idx in self._enabled_idx)
+            self._str_version = self._raw_version
+
+        return self._str_cache
 
 
 def steinhart_temperature_c(
@@ -295,8 +546,14 @@ def steinhart_temperature_c(
     beta: float = 3950.0
 ) -> float:
     """Get temperature from given input_resistance using Steinhart-Hart."""
+    # log(r/fixed) = log(r) - log(fixed), & log(fixed) is precomputed at
+    # import for the default resistor, so the log's argument needs no
+    # division
+    log_fixed = _LOG_FIXED_RESISTOR \
+        if fixed_resistor == FIXED_RESISTOR \
+        else _log(fixed_resistor)
     # log(input_resistance/fixed_resistor) / beta
-    steinhart = math.log(input_resistance / fixed_resistor) / beta
+    steinhart = (_log(input_resistance) - log_fixed) / beta
     # log(input_resistance/fixed_resistor) / beta + 1/nominal_resistance
     steinhart += 1.0 / (nominal_resistance + 273.15)
     steinhart = (1.0 / steinhart) - 273.15   # Invert, convert to C
@@ -305,6 +562,9 @@ def steinhart_temperature_c(
 
 def resistance(value: int) -> float:
     """Get resistance from input ADC value."""
-    num: float = FIXED_RESISTOR
-    den: float = 65535/value - 1
-    return num/den
+    if value == 0:
+        raise ValueError(_OPEN_CIRCUIT)
+
+    # fixed / (65535/value - 1) == fixed * value / (65535 - value), which
+    # costs one division instead of two
+    return FIXED_RESISTOR * value / (65535 - value)
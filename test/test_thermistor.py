@@ -0,0 +1,52 @@
+from unittest import TestCase, main
+
+from smoke.thermistor import (
+    adc_to_c,
+    make_adc_to_c,
+    resistance,
+    steinhart_temperature_c,
+)
+
+
+class TestResistance(TestCase):
+    """Testing behavior of the resistance function."""
+
+    def test_computes_resistance_from_adc_value(self) -> None:
+        """A reading of a fifth of full scale means a quarter of fixed."""
+        self.assertAlmostEqual(resistance(13107), 25000.0)
+
+    def test_raises_on_zero_reading(self) -> None:
+        """A zero reading is an open circuit, not a resistance."""
+        with self.assertRaises(ValueError):
+            resistance(0)
+
+
+class TestSteinhartTemperatureC(TestCase):
+    """Testing behavior of the steinhart_temperature_c function."""
+
+    def test_nominal_resistance_reads_nominal_temperature(self) -> None:
+        """At the fixed resistor's value the probe reads exactly 25 C."""
+        self.assertAlmostEqual(steinhart_temperature_c(100000.0), 25.0)
+
+
+class TestAdcToC(TestCase):
+    """Testing behavior of the adc_to_c function."""
+
+    def test_matches_the_two_step_conversion(self) -> None:
+        """The fused form agrees with resistance + Steinhart-Hart."""
+        for value in (1000, 13107, 32768, 60000):
+            with self.subTest(value=value):
+                expected = steinhart_temperature_c(resistance(value))
+                self.assertAlmostEqual(adc_to_c(value), expected)
+
+    def test_default_closure_matches_module_function(self) -> None:
+        """make_adc_to_c with defaults reproduces adc_to_c."""
+        converter = make_adc_to_c()
+
+        for value in (1000, 13107, 32768, 60000):
+            with self.subTest(value=value):
+                self.assertAlmostEqual(converter(value), adc_to_c(value))
+
+
+if __name__ == "__main__":
+    main()
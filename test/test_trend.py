@@ -1,7 +1,15 @@
 from typing import List, Tuple
 from unittest import TestCase, main
 
-from smoke.trend import simple_slope
+import numpy as np
+
+from smoke.trend import (
+    TrendWindow,
+    regression_slope,
+    simple_slope,
+    simple_slope_arr,
+    simple_slope_uniform,
+)
 
 
 class TestSimpleSlope(TestCase):
@@ -39,5 +47,123 @@ class TestSimpleSlope(TestCase):
         self.assertLess(close_trend, far_trend)
 
 
+class TestSimpleSlopeUniform(TestCase):
+    """Testing behavior of the simple_slope_uniform function."""
+
+    def test_matches_simple_slope_over_expanded_tuples(self) -> None:
+        """The uniform shortcut agrees with the tuple-based original."""
+        y_values = [0.0, 1.0, 1.5, 4.0, 3.5]
+        delta_x = 10.0
+
+        expected = simple_slope([
+            (delta_x * i, y) for i, y in enumerate(y_values)])
+        actual = simple_slope_uniform(y_values, delta_x)
+
+        self.assertAlmostEqual(actual, expected)
+
+    def test_returns_0_if_only_zero_or_one_datapoints_long(self) -> None:
+        """If the data is too short, assume an unchanging trend."""
+        samples: List[Tuple[int, List[float]]] = [
+            (0, []),
+            (0, [10.0]),
+        ]
+
+        for expected, data in samples:
+            with self.subTest():
+                actual = simple_slope_uniform(data, 10.0)
+                self.assertEqual(actual, expected)
+
+
+class TestSimpleSlopeArr(TestCase):
+    """Testing behavior of the simple_slope_arr function."""
+
+    def test_matches_simple_slope_over_the_same_points(self) -> None:
+        """The array entrypoint agrees with the tuple-based shim."""
+        points = [(0.0, 0.0), (1.0, 0.0), (2.0, 3.0), (3.0, 3.0)]
+
+        expected = simple_slope(points)
+        actual = simple_slope_arr(np.asarray(points, dtype=np.float64))
+
+        self.assertAlmostEqual(actual, expected)
+
+    def test_returns_0_if_only_zero_or_one_datapoints_long(self) -> None:
+        """If the data is too short, assume an unchanging trend."""
+        samples = [
+            np.empty((0, 2), dtype=np.float64),
+            np.asarray([[10.0, 10.0]], dtype=np.float64),
+        ]
+
+        for data in samples:
+            with self.subTest():
+                actual = simple_slope_arr(data)
+                self.assertEqual(actual, 0)
+
+
+class TestRegressionSlope(TestCase):
+    """Testing behavior of the regression_slope function."""
+
+    def test_returns_0_if_only_zero_or_one_datapoints_long(self) -> None:
+        """If the data is too short, assume an unchanging trend."""
+        samples: List[Tuple[int, List[float]]] = [
+            (0, []),
+            (0, [10.0]),
+        ]
+
+        for expected, data in samples:
+            with self.subTest():
+                actual = regression_slope(data)
+                self.assertEqual(actual, expected)
+
+    def test_finds_slope_of_a_line(self) -> None:
+        """For perfectly linear data, the slope is exact."""
+        data = [1.0, 3.0, 5.0, 7.0]
+
+        actual = regression_slope(data)
+
+        self.assertAlmostEqual(actual, 2.0)
+
+    def test_scales_slope_by_sample_spacing(self) -> None:
+        """A wider sample spacing means a slower rate of change."""
+        data = [1.0, 3.0, 5.0, 7.0]
+
+        actual = regression_slope(data, 10.0)
+
+        self.assertAlmostEqual(actual, 0.2)
+
+
+class TestTrendWindow(TestCase):
+    """Testing behavior of the TrendWindow class."""
+
+    def test_matches_simple_slope_before_filling_up(self) -> None:
+        """A partially filled window agrees with simple_slope."""
+        points = [(0.0, 0.0), (1.0, 0.0), (2.0, 3.0), (3.0, 3.0)]
+        window = TrendWindow(8)
+
+        for x, y in points:
+            window.push(x, y)
+
+        self.assertAlmostEqual(window.slope(), simple_slope(points))
+
+    def test_evicts_oldest_samples_once_at_capacity(self) -> None:
+        """A full window only sees the most recent capacity samples."""
+        points = [(float(i), float(i * i)) for i in range(10)]
+        window = TrendWindow(4)
+
+        for x, y in points:
+            window.push(x, y)
+
+        self.assertAlmostEqual(window.slope(), simple_slope(points[-4:]))
+
+    def test_returns_0_while_too_short(self) -> None:
+        """If the window is empty or holds one sample, assume no trend."""
+        window = TrendWindow(4)
+
+        self.assertEqual(window.slope(), 0)
+
+        window.push(10.0, 10.0)
+
+        self.assertEqual(window.slope(), 0)
+
+
 if __name__ == "__main__":
     main()